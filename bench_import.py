@@ -0,0 +1,52 @@
+import argparse
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ['tqdm', 'requests', 'urllib3', 'statistics']
+DEFAULT_THRESHOLD = 150
+
+
+def set_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-t', '--threshold', nargs='?', default=DEFAULT_THRESHOLD, const=DEFAULT_THRESHOLD,
+                        help='max median cold-start time of \'rangedl -h\' (ms)', type=int)
+    parser.add_argument('-r', '--repeat', nargs='?', default=10, const=10, help='repeat count', type=int)
+    args = parser.parse_args()
+    return args
+
+
+def check_modules():
+    code = ('import sys, rangedl\n'
+            'print(" ".join(m for m in {0!r} if m in sys.modules))'.format(HEAVY_MODULES))
+    out = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, check=True)
+    return out.stdout.decode().split()
+
+
+def measure_cli(repeat):
+    code = 'import sys; sys.argv = ["rangedl", "-h"]; from rangedl.script import main; main()'
+    times = []
+    for i in range(repeat):
+        begin = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], stdout=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - begin) * 1000)
+    times.sort()
+    return times[len(times) // 2]
+
+
+def main():
+    args = set_args()
+
+    loaded = check_modules()
+    if loaded:
+        print('import rangedl loads ' + ', '.join(loaded), file=sys.stderr)
+        exit(1)
+
+    median = measure_cli(args.repeat)
+    print('rangedl -h cold start ' + '{0:.1f}'.format(median) + ' ms (threshold ' + str(args.threshold) + ' ms)')
+    if median > args.threshold:
+        exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,15 +4,13 @@ import os
 import sys
 import gc
 import time
-import statistics as st
 from urllib.parse import urlparse
 from logging import getLogger, NullHandler, StreamHandler, DEBUG
-from tqdm import tqdm
 from .exceptions import (
     SeparateHeaderError, GetOrderError, HttpResponseError, HeadResponseError, AcceptRangeError, RedirectionError
 )
 from .utils import (
-    get_length, get_order, separate_header, addr2sock, map_all
+    get_length, get_order, separate_header, addr2sock, is_alive, map_all
 )
 
 MAX_NUM_OF_CONNECTION = 10
@@ -52,11 +50,12 @@ class RangeDownloader(object):
             self._part_size = 1000 * 1000
 
         length_list = []
+        head_sockets = {}
         i = 0
         while i < len(urls):
             url = urls[i]
             try:
-                length = get_length(url)
+                length, head_sock = get_length(url)
             except RedirectionError as e:
                 print('Target file \n' +
                       url.scheme + '://' + url.netloc + url.path + '\n' +
@@ -75,9 +74,14 @@ class RangeDownloader(object):
                 exit(1)
             else:
                 length_list.append(length)
+                if head_sock is not None:
+                    head_sockets.setdefault(url, []).append(head_sock)
                 i += 1
 
         if map_all(length_list) is False:
+            for socks in head_sockets.values():
+                for sock in socks:
+                    sock.close()
             print('The size of the target file differs for each mirror', file=sys.stderr)
             exit(1)
 
@@ -107,14 +111,20 @@ class RangeDownloader(object):
 
         for url in urls:
             address = (socket.gethostbyname(url.hostname), port)
+            # reuse the keep-alive connection of the HEAD probe for the first Range GET
+            reusable = head_sockets.get(url, [])
             for i in range(self._conn_num_per_a_address):
-                sock = addr2sock(address)
+                sock = self._pop_alive(reusable) or addr2sock(address)
                 self._sockets[sock.fileno()] = {'socket': sock, 'address': address, 'url': url}
             if conn_reminder > 0:
-                sock = addr2sock(address)
+                sock = self._pop_alive(reusable) or addr2sock(address)
                 self._sockets[sock.fileno()] = {'socket': sock, 'address': address, 'url': url}
                 conn_reminder -= 1
 
+        for socks in head_sockets.values():
+            for sock in socks:
+                sock.close()
+
         self._sel = selectors.DefaultSelector()
         self._filename = os.path.basename(urls[0].path)
         f = open(self._filename, 'wb')
@@ -151,6 +161,15 @@ class RangeDownloader(object):
         if self._progress:
             self._progress_bar = None
 
+    @staticmethod
+    def _pop_alive(socks):
+        while socks:
+            sock = socks.pop()
+            if is_alive(sock):
+                return sock
+            sock.close()
+        return None
+
     def _initial_request(self):
         for key in self._sockets.keys():
             self._request(key, 'GET',
@@ -188,7 +207,7 @@ class RangeDownloader(object):
             self._duplicate_request_func(key=target_key)
 
     def _check_stack_v2(self):
-        ave = st.mean(self._stacks.values())
+        ave = sum(self._stacks.values()) / len(self._stacks)
         for key, stack in self._stacks.items():
             if stack > ave * self._v2_weight:
                 self._duplicate_request_func(key=key)
@@ -270,7 +289,8 @@ class RangeDownloader(object):
         if self._progress:
             self._progress_bar.close()
 
-        self.print_result()
+        if self._debug:
+            self.print_result()
 
     def _check_timeout(self):
         for key, buf in self._sock_buf.items():
@@ -297,6 +317,8 @@ class RangeDownloader(object):
                            )
 
     def print_result(self):
+        import statistics as st
+
         self._logger.debug('\n' +
                            'Total file size ' + str(self._total) + ' bytes' + '\n' +
                            'Time ' + str(self._end_time - self._start_time) + ' sec' + '\n' +
@@ -332,6 +354,7 @@ class RangeDownloader(object):
         self.print_info()
 
         if self._progress:
+            from tqdm import tqdm
             self._progress_bar = tqdm(total=self._length)
 
         self._start_time = time.time()
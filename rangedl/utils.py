@@ -1,4 +1,3 @@
-import requests
 import socket
 from .exceptions import (
     SeparateHeaderError, GetOrderError, HttpResponseError, AcceptRangeError, HeadResponseError, RedirectionError
@@ -6,20 +5,76 @@ from .exceptions import (
 
 
 def get_length(url):
-    hr = requests.head(url.scheme + '://' + url.netloc + url.path)
+    port = url.port or 80
+    sock = socket.create_connection((url.hostname, port))
+
+    try:
+        message = 'HEAD {0} HTTP/1.1\r\nHost: {1}\r\n\r\n'.format(url.path, url.hostname)
+        sock.sendall(message.encode())
+
+        resp = bytearray()
+        while True:
+            try:
+                header, _ = separate_header(resp)
+            except SeparateHeaderError:
+                raw = sock.recv(4096)
+                if not raw:
+                    raise HeadResponseError('Connection closed before HEAD response was received.')
+                resp += raw
+            else:
+                break
+
+        version, status_code, headers = parse_header(header)
+
+        if status_code == 302 or status_code == 303 or status_code == 307:
+            raise RedirectionError(headers['location'])
+
+        elif status_code != 200:
+            raise HeadResponseError('STATUS CODE ' + str(status_code))
+
+        try:
+            headers['accept-ranges']
+        except KeyError:
+            raise AcceptRangeError('Server does not accept Range-header.')
+
+        length = int(headers['content-length'])
+
+    except BaseException:
+        sock.close()
+        raise
+
+    connection = headers.get('connection', '').lower()
+    if version == 'HTTP/1.1':
+        keep_alive = connection != 'close'
+    else:
+        keep_alive = connection == 'keep-alive'
+
+    if keep_alive:
+        sock.setblocking(False)
+    else:
+        sock.close()
+        sock = None
+
+    return length, sock
 
-    if hr.status_code == 302 or hr.status_code == 303 or hr.status_code == 307:
-        raise RedirectionError((hr.headers['Location']))
 
-    elif hr.status_code != 200:
-        raise HeadResponseError('STATUS CODE ' + str(hr.status_code))
+def parse_header(header):
+    lines = header.decode('latin-1').split('\r\n')
+    status_line = lines[0].split(' ', 2)
 
     try:
-        hr.headers['Accept-Ranges']
-    except KeyError:
-        raise AcceptRangeError('Server does not accept Range-header.')
+        version = status_line[0]
+        status_code = int(status_line[1])
+    except (IndexError, ValueError):
+        raise HeadResponseError('Invalid Status-Line: ' + lines[0])
 
-    return int(hr.headers['content-length'])
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(':')
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+
+    return version, status_code, headers
 
 
 def separate_header(resp):
@@ -73,5 +128,17 @@ def addr2sock(address):
     return sock
 
 
+def is_alive(sock):
+    try:
+        data = sock.recv(1, socket.MSG_PEEK)
+    except BlockingIOError:
+        return True
+    except OSError:
+        return False
+
+    # b'' means the peer closed the connection, and any data here would be unsolicited
+    return False
+
+
 def map_all(es):
     return all([e == es[0] for e in es[1:]]) if es else False